@@ -2,11 +2,6 @@
 
 __version__ = "0.1.0"
 
-from .relay import RelayController
-from .dut_logger import DUTLogger, DUTLoggerManager
-from .sequence import SequenceParser, SequenceExecutor
-from .config import Config, load_config
-
 __all__ = [
     "RelayController",
     "DUTLogger",
@@ -16,3 +11,30 @@ __all__ = [
     "Config",
     "load_config",
 ]
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package, e.g. for `hwtester --help`, doesn't pull in pyserial or tomllib.
+_LAZY_IMPORTS = {
+    "RelayController": ".relay",
+    "DUTLogger": ".dut_logger",
+    "DUTLoggerManager": ".dut_logger",
+    "SequenceParser": ".sequence",
+    "SequenceExecutor": ".sequence",
+    "Config": ".config",
+    "load_config": ".config",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        import importlib
+
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -2,6 +2,7 @@
 
 import signal
 import sys
+import threading
 from pathlib import Path
 
 from .cli import create_parser, validate_args
@@ -55,17 +56,40 @@ def main() -> int:
         logger_manager.add_logger(logger)
 
     # Setup signal handler for clean shutdown
-    shutdown_requested = False
+    shutdown_event = threading.Event()
+    # True while only waiting on shutdown_event (DUT-only logging)
+    idle_wait = False
 
     def signal_handler(sig, frame):
-        nonlocal shutdown_requested
-        if shutdown_requested:
-            # Force exit on second Ctrl+C
+        if shutdown_event.is_set():
+            # Force exit on second Ctrl+C (or second termination signal)
             sys.exit(1)
-        shutdown_requested = True
+        shutdown_event.set()
         print("\nShutting down...")
 
+    def terminate_handler(sig, frame):
+        signal_handler(sig, frame)
+        # Nothing but the idle wait watches shutdown_event, so unwind to the
+        # cleanup in the finally block below
+        if not idle_wait:
+            raise SystemExit(128 + sig)
+
     signal.signal(signal.SIGINT, signal_handler)
+    # Termination requests from service managers/containers (Unix), console
+    # close/Ctrl+Break (Windows) and terminal hangup shut down even when
+    # nothing is waiting on shutdown_event
+    for sig_name in ("SIGTERM", "SIGBREAK", "SIGHUP"):
+        sig = getattr(signal, sig_name, None)
+        if sig is None:
+            continue
+        # Leave an ignored SIGHUP alone so "nohup hwtester ..." keeps running
+        if sig_name == "SIGHUP" and signal.getsignal(sig) is signal.SIG_IGN:
+            continue
+        signal.signal(sig, terminate_handler)
+
+    # Set before the try so the finally block can always read it, even when a
+    # signal or error arrives before the loggers have started
+    log_paths = []
 
     try:
         # Connect relay if configured
@@ -138,12 +162,17 @@ def main() -> int:
             if config.dut_ports and not relay_controller:
                 if not args.quiet:
                     print("Logging DUT ports. Press Ctrl+C to stop.")
+                idle_wait = True
                 try:
-                    # Wait until interrupted
-                    while not shutdown_requested:
-                        signal.pause() if hasattr(signal, "pause") else __import__("time").sleep(0.1)
+                    # Wait until interrupted. The timeout keeps Ctrl+C
+                    # responsive on Windows, where an untimed wait can't be
+                    # interrupted by a signal.
+                    while not shutdown_event.wait(timeout=1.0):
+                        pass
                 except KeyboardInterrupt:
                     pass
+                finally:
+                    idle_wait = False
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
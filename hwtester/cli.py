@@ -3,9 +3,21 @@
 import argparse
 import sys
 from pathlib import Path
+from typing import Optional
+
+# Built on first use and reused; parse_args() doesn't mutate the parser
+_parser: Optional[argparse.ArgumentParser] = None
 
 
 def create_parser() -> argparse.ArgumentParser:
+    """Return the configured argument parser, building it on first call."""
+    global _parser
+    if _parser is None:
+        _parser = _build_parser()
+    return _parser
+
+
+def _build_parser() -> argparse.ArgumentParser:
     """Create and configure argument parser."""
 
     parser = argparse.ArgumentParser(
@@ -30,9 +42,10 @@ Examples:
   hwtester -c config.toml -s "R2:ON,D1000,R2:OFF"
 
 Sequence format:
-  R<n>:ON   - Turn relay n on (0-15)
-  R<n>:OFF  - Turn relay n off (0-15)
+  R<n>:ON   - Turn relay n on (1-16)
+  R<n>:OFF  - Turn relay n off (1-16)
   D<ms>     - Delay in milliseconds
+  I         - Reset all relays to off
 
   Example: R1:ON,D500,R2:ON,D1000,R1:OFF,R2:OFF
 """,
@@ -1,16 +1,11 @@
 """TOML configuration loading and validation."""
 
+import copy
 import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-# Python 3.11+ has tomllib built-in
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    import tomli as tomllib
-
 
 @dataclass
 class DUTPortConfig:
@@ -41,10 +36,17 @@ class Config:
     sequence: Optional[str] = None
 
 
+# Parsed configs keyed by resolved path, with the (mtime, size) they were parsed at
+_toml_cache: dict[Path, tuple[float, int, Config]] = {}
+
+
 def load_config(config_path: Path) -> Config:
     """
     Load configuration from TOML file.
 
+    Parsed results are cached per file and reused while the file's mtime and
+    size are unchanged. Each call returns an independent copy.
+
     Args:
         config_path: Path to TOML config file
 
@@ -56,6 +58,26 @@ def load_config(config_path: Path) -> Config:
         tomllib.TOMLDecodeError: If TOML is invalid
         ValueError: If config values are invalid
     """
+    st = Path(config_path).stat()
+    key = Path(config_path).resolve()
+    cached = _toml_cache.get(key)
+    if cached and cached[:2] == (st.st_mtime, st.st_size):
+        return copy.deepcopy(cached[2])
+
+    config = _parse_config(key)
+    _toml_cache[key] = (st.st_mtime, st.st_size, copy.deepcopy(config))
+    return config
+
+
+def _parse_config(config_path: Path) -> Config:
+    """Parse a TOML config file into a Config object."""
+    # Imported here so tomllib is only loaded when a config file is used.
+    # Python 3.11+ has tomllib built-in
+    if sys.version_info >= (3, 11):
+        import tomllib
+    else:
+        import tomli as tomllib
+
     with open(config_path, "rb") as f:
         data = tomllib.load(f)
 
@@ -66,13 +88,16 @@ def load_config(config_path: Path) -> Config:
         relay_section = data["relay"]
         config.relay_port = relay_section.get("port")
 
-        # Load relay aliases
-        if "aliases" in relay_section:
-            aliases = relay_section["aliases"]
-            for name, relay_num in aliases.items():
-                if not isinstance(relay_num, int) or not 1 <= relay_num <= 16:
-                    raise ValueError(f"Relay alias '{name}' has invalid relay number: {relay_num}")
-                config.relay_aliases[name] = relay_num
+        # Load relay aliases, validating them all in one pass
+        aliases = relay_section.get("aliases", {})
+        bad = [
+            f"'{name}' -> {relay_num}"
+            for name, relay_num in aliases.items()
+            if not (isinstance(relay_num, int) and 1 <= relay_num <= 16)
+        ]
+        if bad:
+            raise ValueError(f"Relay aliases have invalid relay numbers: {', '.join(bad)}")
+        config.relay_aliases.update(aliases)
 
     # DUT ports
     if "dut" in data:
@@ -118,26 +143,28 @@ def merge_config_with_args(config: Config, args) -> Config:
     """
     Merge CLI arguments over config file values.
 
-    CLI args take precedence over config file.
+    CLI args take precedence over config file. Expects the namespace from
+    cli.create_parser(), which always defines every option (unset ones are
+    None/False).
     """
-    if hasattr(args, "relay_port") and args.relay_port:
+    if args.relay_port:
         config.relay_port = args.relay_port
 
-    if hasattr(args, "log_dir") and args.log_dir:
+    if args.log_dir:
         config.log_dir = Path(args.log_dir)
 
-    if hasattr(args, "dut_ports") and args.dut_ports:
+    if args.dut_ports:
         # CLI DUT ports override config
-        baud_rate = getattr(args, "baud_rate", 115200) or 115200
+        baud_rate = args.baud_rate or 115200
         config.dut_ports = [DUTPortConfig(port=p, baud_rate=baud_rate) for p in args.dut_ports]
 
-    if hasattr(args, "sequence") and args.sequence:
+    if args.sequence:
         config.sequence = args.sequence
 
-    if hasattr(args, "timestamp_lines") and args.timestamp_lines:
+    if args.timestamp_lines:
         config.timestamp_lines = True
 
-    if hasattr(args, "log_prefix") and args.log_prefix:
+    if args.log_prefix:
         config.log_prefix = args.log_prefix
 
     return config
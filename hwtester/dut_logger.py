@@ -1,12 +1,22 @@
 """Threaded DUT serial port logging."""
 
+import io
+import os
+import selectors
+import sys
 import threading
+import time
 from pathlib import Path
-from typing import Optional, TextIO
+from typing import TYPE_CHECKING, Optional
 
-import serial
+from .utils import format_line_timestamp, format_timestamp
 
-from .utils import format_timestamp, format_line_timestamp
+# pyserial is imported where it's used so importing hwtester stays cheap
+if TYPE_CHECKING:
+    import serial
+
+# Characters in port names that can't appear in log filenames
+_PORT_NAME_TRANS = str.maketrans({"/": "_", "\\": "_", ":": None})
 
 
 class DUTLogger:
@@ -14,9 +24,22 @@ class DUTLogger:
     Logs serial output from a DUT port to a file.
 
     Runs in a background thread, reading from serial and writing to log file.
-    Thread-safe start/stop operations.
+    When started by a DUTLoggerManager on a POSIX system, the port is instead
+    serviced by the manager's shared reader thread.
+
+    Only the reading thread writes to the log, so writes take no lock; stop()
+    closes the log file after that thread has finished, and leaves it open if
+    the thread doesn't stop in time.
+
+    Lines are written to the log as the raw bytes received from the port.
+    Log writes are collected in memory and written straight to the file
+    descriptor every FLUSH_INTERVAL seconds or FLUSH_BYTES bytes, whichever
+    comes first, and whenever the port goes idle.
     """
 
+    FLUSH_INTERVAL = 0.25
+    FLUSH_BYTES = 65536
+
     def __init__(
         self,
         port: str,
@@ -41,15 +64,19 @@ class DUTLogger:
         self.log_dir = Path(log_dir)
         self.baud_rate = baud_rate
         self.timestamp_lines = timestamp_lines
-        self.port_name = port_name or port.replace("/", "_").replace("\\", "_").replace(":", "")
+        self.port_name = port_name or port.translate(_PORT_NAME_TRANS)
         self.log_prefix = log_prefix
 
-        self._serial: Optional[serial.Serial] = None
-        self._log_file: Optional[TextIO] = None
+        self._serial: Optional["serial.Serial"] = None
+        self._log_fd: Optional[int] = None
+        # Log output not yet written to _log_fd
+        self._out = bytearray()
         self._log_path: Optional[Path] = None
         self._thread: Optional[threading.Thread] = None
+        # Partial line carried between reads
+        self._buffer = bytearray()
         self._stop_event = threading.Event()
-        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
 
     def _generate_log_filename(self) -> Path:
         """Generate log filename with timestamp."""
@@ -62,41 +89,120 @@ class DUTLogger:
 
     def _log_loop(self) -> None:
         """Main logging loop running in background thread."""
-        buffer = b""
-
         while not self._stop_event.is_set():
-            try:
-                # Read available data with timeout
-                if self._serial and self._serial.in_waiting > 0:
-                    data = self._serial.read(self._serial.in_waiting)
-                    buffer += data
-
-                    # Process complete lines
-                    while b"\n" in buffer:
-                        line, buffer = buffer.split(b"\n", 1)
-                        # Strip \r and whitespace from line endings
-                        decoded_line = line.decode("utf-8", errors="replace").rstrip()
-                        self._write_line(decoded_line)
-                else:
-                    # Small sleep to prevent busy-waiting
-                    self._stop_event.wait(timeout=0.01)
-
-            except serial.SerialException as e:
-                self._write_line(f"[SERIAL ERROR: {e}]")
+            # Returns whatever is waiting, or blocks for up to the port timeout
+            # for one byte, so the stop event is re-checked at least that often
+            data = self._read()
+            if data is None:
                 break
+            if not data:
+                # Port is idle, get buffered output onto disk
+                self._flush()
+                continue
+            self._split_lines(data)
 
-        # Flush remaining buffer
-        if buffer:
-            self._write_line(buffer.decode("utf-8", errors="replace"))
+        # Flush remaining partial line
+        self._flush_partial()
 
-    def _write_line(self, line: str) -> None:
+    def _drain_ready(self) -> bool:
+        """
+        Read whatever is waiting on the port and log complete lines.
+
+        Called from the manager's reader thread when the port is readable.
+
+        Returns:
+            False if the port failed and should no longer be watched
+        """
+        # A readable port with nothing waiting means it went away; _read()'s
+        # read(1) turns that into a SerialException
+        data = self._read()
+        if data is None:
+            return False
+        self._split_lines(data)
+        return True
+
+    def _read(self) -> Optional[bytes]:
+        """
+        Read the bytes waiting on the port, or wait up to the timeout for one.
+
+        Returns:
+            The data read (empty if the read timed out), or None if the port
+            failed; the error is written to the log
+        """
+        try:
+            return self._serial.read(self._serial.in_waiting or 1)
+        except OSError as e:
+            # serial.SerialException, or the in_waiting ioctl failing
+            self._write_line(f"[SERIAL ERROR: {e}]".encode("utf-8", errors="replace"))
+            return None
+
+    def _split_lines(self, data: bytes) -> None:
+        """Log the complete lines in data, keeping any partial line for later."""
+        # Extend in place and trim consumed lines once per read, keeping
+        # buffering linear however the data is chunked
+        buffer = self._buffer
+        buffer += data
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            # Strip \r and whitespace from line endings
+            self._write_line(buffer[start:end].rstrip())
+            start = end + 1
+        del buffer[:start]
+
+    def _flush_partial(self) -> None:
+        """Log any partial line left over in the read buffer."""
+        if self._buffer:
+            self._write_line(self._buffer)
+            self._buffer.clear()
+
+    def _write_line(self, line: bytes) -> None:
         """Write a line to log file with optional timestamp."""
-        with self._lock:
-            if self._log_file:
-                if self.timestamp_lines:
-                    line = format_line_timestamp() + line
-                self._log_file.write(line + "\n")
-                self._log_file.flush()
+        if self._log_fd is not None:
+            out = self._out
+            if self.timestamp_lines:
+                out += format_line_timestamp().encode("ascii")
+            out += line
+            out += b"\n"
+            if (
+                len(out) >= self.FLUSH_BYTES
+                or time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL
+            ):
+                self._flush()
+
+    def _flush(self) -> None:
+        """Flush any buffered log output."""
+        if self._log_fd is not None and self._out:
+            # One syscall per batch; loop in case of a short write
+            out = self._out
+            while out:
+                del out[: os.write(self._log_fd, out)]
+        self._last_flush = time.monotonic()
+
+    def _enable_low_latency(self) -> None:
+        """
+        Best-effort switch of the port into low-latency mode (Linux only).
+
+        USB-serial adapters such as FTDI hold received data for up to their
+        latency timer (16ms by default) before handing it to the host. Drop
+        the timer to 1ms via sysfs and set ASYNC_LOW_LATENCY on the tty.
+        Failures (no permission, not a USB adapter) are ignored.
+        """
+        if not sys.platform.startswith("linux"):
+            return
+
+        tty_name = os.path.basename(os.path.realpath(self.port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{tty_name}/latency_timer", "w") as f:
+                f.write("1")
+        except OSError:
+            pass
+
+        # pyserial wraps TIOCGSERIAL/TIOCSSERIAL on Linux
+        if hasattr(self._serial, "set_low_latency_mode"):
+            try:
+                self._serial.set_low_latency_mode(True)
+            except (ValueError, OSError):
+                pass
 
     def start(self) -> Path:
         """
@@ -109,24 +215,40 @@ class DUTLogger:
             serial.SerialException: If port cannot be opened
             OSError: If log directory cannot be created
         """
+        self._open()
+
+        # Start logging thread
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._log_loop, daemon=True)
+        self._thread.start()
+
+        return self._log_path
+
+    def _open(self) -> Path:
+        """Open the log file and serial port without starting a reader."""
         # Create log directory
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
         # Open log file
         self._log_path = self._generate_log_filename()
-        self._log_file = open(self._log_path, "w", encoding="utf-8")
+        self._log_fd = os.open(
+            self._log_path,
+            os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        self._out.clear()
+        self._last_flush = time.monotonic()
 
         # Open serial port
+        import serial
+
         self._serial = serial.Serial(
             port=self.port,
             baudrate=self.baud_rate,
             timeout=0.1,
         )
-
-        # Start logging thread
-        self._stop_event.clear()
-        self._thread = threading.Thread(target=self._log_loop, daemon=True)
-        self._thread.start()
+        self._enable_low_latency()
+        self._buffer.clear()
 
         return self._log_path
 
@@ -134,18 +256,36 @@ class DUTLogger:
         """Stop logging and close resources."""
         self._stop_event.set()
 
+        reader_alive = False
         if self._thread:
             self._thread.join(timeout=2.0)
+            reader_alive = self._thread.is_alive()
             self._thread = None
 
+        self._close(reader_alive)
+
+    def _close(self, reader_alive: bool) -> None:
+        """
+        Close the serial port and log file.
+
+        If the thread reading this port is still running it may yet write to the
+        log, so in that case everything is left open rather than closing the fd
+        (or the port) out from under it.
+        """
+        if reader_alive:
+            print(f"Warning: Reader for {self.port} did not stop; leaving its port and log open")
+            return
+
         if self._serial and self._serial.is_open:
             self._serial.close()
             self._serial = None
 
-        with self._lock:
-            if self._log_file:
-                self._log_file.close()
-                self._log_file = None
+        # The reader has stopped, so nothing else touches the log from here
+        if self._log_fd is not None:
+            self._flush()
+            os.fsync(self._log_fd)
+            os.close(self._log_fd)
+            self._log_fd = None
 
     @property
     def log_path(self) -> Optional[Path]:
@@ -161,31 +301,122 @@ class DUTLogger:
 
 
 class DUTLoggerManager:
-    """Manages multiple DUT loggers."""
+    """
+    Manages multiple DUT loggers.
+
+    On POSIX systems all ports are registered with one selector and read from
+    a single thread, so the thread count stays constant however many DUTs are
+    attached. Ports that cannot be selected on (e.g. on Windows, where
+    selectors only support sockets) get their own thread.
+    """
 
     def __init__(self):
         self._loggers: list[DUTLogger] = []
+        self._selector: Optional[selectors.BaseSelector] = None
+        self._reader_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
 
     def add_logger(self, logger: DUTLogger) -> None:
         """Add a logger to manage."""
         self._loggers.append(logger)
 
+    @staticmethod
+    def _fileno(logger: DUTLogger) -> Optional[int]:
+        """Return the logger's serial fd if it can be selected on."""
+        if os.name != "posix":
+            return None
+        try:
+            return logger._serial.fileno()
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            return None
+
     def start_all(self) -> list[Path]:
         """Start all loggers, return list of log file paths."""
+        import serial
+
         paths = []
+        selected = []
         for logger in self._loggers:
             try:
-                path = logger.start()
-                paths.append(path)
-                print(f"Logging {logger.port} -> {path}")
+                path = logger._open()
             except serial.SerialException as e:
                 print(f"Warning: Could not open {logger.port}: {e}")
+                continue
+
+            fd = self._fileno(logger)
+            if fd is not None:
+                selected.append((fd, logger))
+            else:
+                logger._stop_event.clear()
+                logger._thread = threading.Thread(target=logger._log_loop, daemon=True)
+                logger._thread.start()
+
+            paths.append(path)
+            print(f"Logging {logger.port} -> {path}")
+
+        if selected:
+            self._selector = selectors.DefaultSelector()
+            for fd, logger in selected:
+                self._selector.register(fd, selectors.EVENT_READ, data=logger)
+
+            self._stop_event.clear()
+            self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader_thread.start()
+
         return paths
 
+    def _reader_loop(self) -> None:
+        """Read from every selected port, running in one background thread."""
+        selector = self._selector
+        loggers = [key.data for key in selector.get_map().values()]
+        last_flush = time.monotonic()
+
+        while not self._stop_event.is_set():
+            for key, _ in selector.select(timeout=DUTLogger.FLUSH_INTERVAL):
+                if not key.data._drain_ready():
+                    selector.unregister(key.fileobj)
+
+            # Time-based flush, so idle ports still reach disk
+            now = time.monotonic()
+            if now - last_flush >= DUTLogger.FLUSH_INTERVAL:
+                for logger in loggers:
+                    logger._flush()
+                last_flush = now
+
+        for logger in loggers:
+            logger._flush_partial()
+
+    def _stop_reader(self) -> bool:
+        """
+        Stop the shared reader thread and release the selector.
+
+        Returns:
+            True if the thread is still running after the join timeout; the
+            selector is then left open for it
+        """
+        self._stop_event.set()
+        thread = self._reader_thread
+        if thread:
+            thread.join(timeout=2.0)
+            self._reader_thread = None
+            if thread.is_alive():
+                return True
+
+        if self._selector:
+            self._selector.close()
+            self._selector = None
+        return False
+
     def stop_all(self) -> None:
         """Stop all loggers."""
+        reader_alive = self._stop_reader()
         for logger in self._loggers:
-            logger.stop()
+            if reader_alive and logger._thread is None:
+                # Serviced by the shared reader, which hasn't stopped
+                logger._stop_event.set()
+                logger._close(reader_alive=True)
+            else:
+                logger.stop()
 
     def __enter__(self) -> "DUTLoggerManager":
         self.start_all()
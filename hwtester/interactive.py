@@ -5,7 +5,20 @@ import time
 from typing import Optional
 
 from .relay import RelayController
-from .sequence import SequenceExecutor
+from .sequence import SequenceExecutor, SequenceParser
+
+# All pattern commands in one regex, dispatched on which named group matched.
+# Matched case-insensitively against the original line so "seq" keeps the
+# sequence's case.
+_CMD_RE = re.compile(
+    r"^(?:"
+    r"r(?P<relay>[a-z0-9_]+)\s+(?P<state>on|off)"  # r1 on, ralias off
+    r"|d(?P<delay>\d+)"  # d500
+    r"|raw\s+(?P<hex>[0-9a-f\s]+)"  # raw FE0500...
+    r"|seq\s+(?P<seq>.+)"  # seq R1:ON,D500,R1:OFF
+    r")$",
+    re.IGNORECASE,
+)
 
 
 class InteractiveMode:
@@ -36,8 +49,20 @@ class InteractiveMode:
             else None
         )
         self.relay_aliases = relay_aliases or {}
+        # Resolves relay ids the same way sequences do
+        self._parser = SequenceParser(self.relay_aliases)
         self._running = False
 
+        # Commands matched by their whole (lowercased) text
+        self._exact = {
+            "quit": self._quit_command,
+            "exit": self._quit_command,
+            "q": self._quit_command,
+            "help": self._help_command,
+            "status": self._status_command,
+            "i": self._reset_command,
+        }
+
     def print_help(self) -> None:
         """Print help message."""
         help_text = """
@@ -74,6 +99,9 @@ Examples:
         """
         Process a single command.
 
+        Fixed keywords are looked up directly; everything else goes through
+        a single combined pattern.
+
         Returns:
             False if should exit, True to continue
         """
@@ -83,113 +111,120 @@ Examples:
         if not line:
             return True
 
-        # Quit command
-        if line_lower in ("quit", "exit", "q"):
-            return False
+        # Fixed keywords: quit, help, status, I
+        handler = self._exact.get(line_lower)
+        if handler:
+            return handler()
 
-        # Help command
-        if line_lower == "help":
-            self.print_help()
-            return True
+        match = _CMD_RE.match(line)
+        if match:
+            relay_id = match.group("relay")
+            if relay_id is not None:
+                return self._relay_command(relay_id.lower(), match.group("state").lower() == "on")
 
-        # Status command
-        if line_lower == "status":
-            if self.relay and self.relay._serial and self.relay._serial.is_open:
-                print(f"Relay port: {self.relay.port} (connected)")
-            else:
-                print("Relay port: not connected")
-            return True
+            delay = match.group("delay")
+            if delay is not None:
+                return self._delay_command(int(delay))
 
-        # Reset command: I
-        if line_lower == "i":
-            if not self.relay:
-                print("Error: No relay port configured")
-                return True
+            hex_str = match.group("hex")
+            if hex_str is not None:
+                return self._raw_command(hex_str)
 
-            try:
-                self.relay.reset_all_relays()
-                print("All relays reset to OFF")
-            except Exception as e:
-                print(f"Serial error: {e}")
+            return self._seq_command(match.group("seq"))
 
-            return True
+        print(f"Unknown command: {line}")
+        print("Type 'help' for available commands")
+        return True
 
-        # Relay command: r1 on, r15 off, or ralias on/off
-        relay_match = re.match(r"^r([a-z0-9_]+)\s+(on|off)$", line_lower)
-        if relay_match:
-            if not self.relay:
-                print("Error: No relay port configured")
-                return True
+    def _quit_command(self) -> bool:
+        """Exit interactive mode."""
+        return False
 
-            relay_id = relay_match.group(1)
-            on = relay_match.group(2) == "on"
+    def _help_command(self) -> bool:
+        """Show help."""
+        self.print_help()
+        return True
 
-            # Try to parse as number first, then check aliases
-            try:
-                relay_num = int(relay_id)
-            except ValueError:
-                # Not a number, check if it's an alias
-                if relay_id in self.relay_aliases:
-                    relay_num = self.relay_aliases[relay_id]
-                else:
-                    print(f"Error: Unknown relay alias '{relay_id}'")
-                    return True
+    def _status_command(self) -> bool:
+        """Show relay connection status."""
+        if self.relay and self.relay._serial and self.relay._serial.is_open:
+            print(f"Relay port: {self.relay.port} (connected)")
+        else:
+            print("Relay port: not connected")
+        return True
 
-            try:
-                self.relay.set_relay(relay_num, on)
-                state = "ON" if on else "OFF"
-                if relay_id.isdigit():
-                    print(f"Relay {relay_num} -> {state}")
-                else:
-                    print(f"Relay {relay_id} (#{relay_num}) -> {state}")
-            except ValueError as e:
-                print(f"Error: {e}")
-            except Exception as e:
-                print(f"Serial error: {e}")
+    def _reset_command(self) -> bool:
+        """Reset all relays to OFF."""
+        if not self.relay:
+            print("Error: No relay port configured")
+            return True
+
+        try:
+            self.relay.reset_all_relays()
+            print("All relays reset to OFF")
+        except Exception as e:
+            print(f"Serial error: {e}")
+
+        return True
 
+    def _relay_command(self, relay_id: str, on: bool) -> bool:
+        """Switch a relay by number or alias."""
+        if not self.relay:
+            print("Error: No relay port configured")
             return True
 
-        # Delay command: d500
-        delay_match = re.match(r"^d(\d+)$", line_lower)
-        if delay_match:
-            duration_ms = int(delay_match.group(1))
-            print(f"Waiting {duration_ms}ms...")
-            time.sleep(duration_ms / 1000.0)
+        # Number or alias, case-insensitive like sequences
+        relay_num = self._parser.resolve_relay(relay_id)
+        if relay_num is None:
+            print(f"Error: Unknown relay alias '{relay_id}'")
             return True
 
-        # Raw command: raw FE0500...
-        raw_match = re.match(r"^raw\s+([0-9a-f\s]+)$", line_lower)
-        if raw_match:
-            if not self.relay:
-                print("Error: No relay port configured")
-                return True
+        try:
+            self.relay.set_relay(relay_num, on)
+            state = "ON" if on else "OFF"
+            if relay_id.isdigit():
+                print(f"Relay {relay_num} -> {state}")
+            else:
+                print(f"Relay {relay_id} (#{relay_num}) -> {state}")
+        except ValueError as e:
+            print(f"Error: {e}")
+        except Exception as e:
+            print(f"Serial error: {e}")
 
-            hex_str = raw_match.group(1).replace(" ", "")
-            try:
-                data = bytes.fromhex(hex_str)
-                self.relay.send_raw(data)
-                print(f"Sent {len(data)} bytes")
-            except ValueError:
-                print("Error: Invalid hex string")
+        return True
 
+    def _delay_command(self, duration_ms: int) -> bool:
+        """Wait for the given number of milliseconds."""
+        print(f"Waiting {duration_ms}ms...")
+        time.sleep(duration_ms / 1000.0)
+        return True
+
+    def _raw_command(self, hex_str: str) -> bool:
+        """Send raw hex bytes to the relay port."""
+        if not self.relay:
+            print("Error: No relay port configured")
             return True
 
-        # Sequence command: seq R1:ON,D500,R1:OFF
-        seq_match = re.match(r"^seq\s+(.+)$", line, re.IGNORECASE)
-        if seq_match:
-            if not self.executor:
-                print("Error: No relay port configured")
-                return True
+        try:
+            data = bytes.fromhex(hex_str.replace(" ", ""))
+            self.relay.send_raw(data)
+            print(f"Sent {len(data)} bytes")
+        except ValueError:
+            print("Error: Invalid hex string")
 
-            try:
-                self.executor.execute_string(seq_match.group(1))
-            except ValueError as e:
-                print(f"Sequence error: {e}")
+        return True
 
+    def _seq_command(self, sequence_str: str) -> bool:
+        """Execute a command sequence."""
+        if not self.executor:
+            print("Error: No relay port configured")
             return True
 
-        print(f"Unknown command: {line}")
-        print("Type 'help' for available commands")
+        try:
+            self.executor.execute_string(sequence_str)
+        except ValueError as e:
+            print(f"Sequence error: {e}")
+
         return True
 
     def run(self) -> None:
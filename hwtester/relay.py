@@ -1,12 +1,15 @@
 """Relay controller with Intel Hex protocol support."""
 
+import contextlib
 import threading
-from typing import Optional
-
-import serial
+from typing import TYPE_CHECKING, Callable, Optional, Sequence
 
 from .utils import calculate_intel_hex_checksum
 
+# pyserial is imported where it's used so importing hwtester stays cheap
+if TYPE_CHECKING:
+    import serial
+
 
 class RelayController:
     """
@@ -21,26 +24,42 @@ class RelayController:
     - 00 = padding
     - ZZ = checksum
 
-    Thread-safe for concurrent access.
+    Thread-safe for concurrent access unless created with thread_safe=False.
     """
 
     RELAY_ON = 0xFF
     RELAY_OFF = 0x00
     MIN_RELAY = 1
     MAX_RELAY = 16
+    BAUD_RATE = 9600
 
-    def __init__(self, port: str, timeout: float = 1.0):
+    def __init__(self, port: str, timeout: float = 1.0, thread_safe: bool = True):
         """
         Initialize relay controller.
 
         Args:
             port: Serial port name (e.g., 'COM3' or '/dev/ttyUSB0')
             timeout: Serial read timeout in seconds
+            thread_safe: If False, skip locking around writes. Only safe when
+                the controller is used from a single thread.
         """
         self.port = port
         self.timeout = timeout
-        self._serial: Optional[serial.Serial] = None
-        self._lock = threading.Lock()
+        self._serial: Optional["serial.Serial"] = None
+        self._lock = threading.Lock() if thread_safe else contextlib.nullcontext()
+        # Bound write/flush of the open port; None while disconnected
+        self._write: Optional[Callable[[bytes], Optional[int]]] = None
+        self._flush: Optional[Callable[[], None]] = None
+
+        # Every relay command is one of 32 fixed frames, so build them once.
+        # Indexed [relay_num - 1][0 for OFF, 1 for ON].
+        self._cmd_table = [
+            (
+                self._build_command(relay_num, self.RELAY_OFF),
+                self._build_command(relay_num, self.RELAY_ON),
+            )
+            for relay_num in range(self.MIN_RELAY, self.MAX_RELAY + 1)
+        ]
 
     def connect(self) -> None:
         """
@@ -49,17 +68,23 @@ class RelayController:
         Raises:
             serial.SerialException: If port cannot be opened
         """
+        import serial
+
         self._serial = serial.Serial(
             port=self.port,
-            baudrate=9600,
+            baudrate=self.BAUD_RATE,
             bytesize=serial.EIGHTBITS,
             parity=serial.PARITY_NONE,
             stopbits=serial.STOPBITS_ONE,
             timeout=self.timeout,
         )
+        self._write = self._serial.write
+        self._flush = self._serial.flush
 
     def disconnect(self) -> None:
         """Close serial connection."""
+        self._write = None
+        self._flush = None
         if self._serial and self._serial.is_open:
             self._serial.close()
             self._serial = None
@@ -78,17 +103,16 @@ class RelayController:
         # Convert user relay number (1-16) to hardware relay number (0-15)
         hardware_relay = relay_num - 1
         # Build the data portion: FE 05 00 [relay] [state] 00
-        data_bytes = bytes([0xFE, 0x05, 0x00, hardware_relay, state, 0x00])
+        data_bytes = bytes((0xFE, 0x05, 0x00, hardware_relay, state, 0x00))
         checksum = calculate_intel_hex_checksum(data_bytes)
 
-        # Format as Intel Hex string
-        hex_str = "".join(f"{b:02X}" for b in data_bytes)
-        command = f":{hex_str}{checksum:02X}\r\n"
-        return command.encode("ascii")
+        # Format as Intel Hex: ':' + uppercase hex of data and checksum + CRLF
+        payload = data_bytes + bytes((checksum,))
+        return b":" + payload.hex().upper().encode("ascii") + b"\r\n"
 
-    def set_relay(self, relay_num: int, on: bool) -> None:
+    def command_bytes(self, relay_num: int, on: bool) -> bytes:
         """
-        Set relay state.
+        Return the precomputed command frame for a relay state.
 
         Args:
             relay_num: Relay number (1-16)
@@ -96,23 +120,68 @@ class RelayController:
 
         Raises:
             ValueError: If relay number is out of range
-            RuntimeError: If not connected
-            serial.SerialException: On communication error
         """
         if not self.MIN_RELAY <= relay_num <= self.MAX_RELAY:
             raise ValueError(
                 f"Relay number must be {self.MIN_RELAY}-{self.MAX_RELAY}, got {relay_num}"
             )
+        return self._cmd_table[relay_num - 1][1 if on else 0]
 
-        if not self._serial or not self._serial.is_open:
+    def transmit_time_ms(self, nbytes: int) -> float:
+        """Return how long nbytes take to go out on the wire at BAUD_RATE."""
+        # 8N1 framing: start bit + 8 data bits + stop bit per byte
+        return nbytes * 10 * 1000 / self.BAUD_RATE
+
+    def set_relay(self, relay_num: int, on: bool, flush: bool = True) -> None:
+        """
+        Set relay state.
+
+        Args:
+            relay_num: Relay number (1-16)
+            on: True for ON, False for OFF
+            flush: If True (default), wait until the bytes have been
+                transmitted before returning
+
+        Raises:
+            ValueError: If relay number is out of range
+            RuntimeError: If not connected
+            serial.SerialException: On communication error
+        """
+        command = self.command_bytes(relay_num, on)
+
+        write = self._write
+        if write is None:
             raise RuntimeError("Not connected to relay board")
 
-        state = self.RELAY_ON if on else self.RELAY_OFF
-        command = self._build_command(relay_num, state)
+        with self._lock:
+            write(command)
+            if flush:
+                self._flush()
+
+    def write_many(self, commands: Sequence[bytes], flush: bool = True) -> None:
+        """
+        Send several command frames in a single write.
+
+        The frames go out back to back in order, exactly as separate writes
+        would, but with one write/flush for the whole batch.
+
+        Args:
+            commands: Command frames, e.g. from command_bytes()
+            flush: If True (default), wait until the bytes have been
+                transmitted before returning
+
+        Raises:
+            RuntimeError: If not connected
+            serial.SerialException: On communication error
+        """
+        write = self._write
+        if write is None:
+            raise RuntimeError("Not connected to relay board")
 
         with self._lock:
-            self._serial.write(command)
-            self._serial.flush()
+            write(b"".join(commands))
+            if flush:
+                self._flush()
 
     def relay_on(self, relay_num: int) -> None:
         """Turn relay ON."""
@@ -132,29 +201,34 @@ class RelayController:
             RuntimeError: If not connected
             serial.SerialException: On communication error
         """
-        if not self._serial or not self._serial.is_open:
+        write = self._write
+        if write is None:
             raise RuntimeError("Not connected to relay board")
 
         # Command to turn all relays off: :FE0F00000010020000E1
         command = b":FE0F00000010020000E1\r\n"
 
         with self._lock:
-            self._serial.write(command)
-            self._serial.flush()
+            write(command)
+            self._flush()
 
-    def send_raw(self, data: bytes) -> None:
+    def send_raw(self, data: bytes, flush: bool = True) -> None:
         """
         Send raw bytes to relay port (for debugging/advanced use).
 
         Args:
             data: Raw bytes to send
+            flush: If True (default), wait until the bytes have been
+                transmitted before returning
         """
-        if not self._serial or not self._serial.is_open:
+        write = self._write
+        if write is None:
             raise RuntimeError("Not connected to relay board")
 
         with self._lock:
-            self._serial.write(data)
-            self._serial.flush()
+            write(data)
+            if flush:
+                self._flush()
 
     def __enter__(self) -> "RelayController":
         self.connect()
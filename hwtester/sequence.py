@@ -1,39 +1,62 @@
 """Sequence parsing and execution."""
 
-import re
+import atexit
+import functools
+import sys
 import time
+import weakref
+from array import array
 from dataclasses import dataclass
-from typing import Union
+from typing import Optional, Sequence, Union
 
 from .relay import RelayController
 
 
-@dataclass
+# Display strings for every valid relay command, built once
+_RELAY_STRS = {
+    (relay_num, on): f"R{relay_num}:{'ON' if on else 'OFF'}"
+    for relay_num in range(RelayController.MIN_RELAY, RelayController.MAX_RELAY + 1)
+    for on in (False, True)
+}
+
+
+# Commands are immutable values; __slots__ is spelled out because
+# dataclass(slots=True) needs Python 3.10.
+@dataclass(frozen=True)
 class RelayCommand:
     """Relay on/off command."""
 
+    __slots__ = ("relay_num", "on")
+
     relay_num: int
     on: bool
 
     def __str__(self) -> str:
-        state = "ON" if self.on else "OFF"
-        return f"R{self.relay_num}:{state}"
+        text = _RELAY_STRS.get((self.relay_num, self.on))
+        if text is None:
+            state = "ON" if self.on else "OFF"
+            text = f"R{self.relay_num}:{state}"
+        return text
 
 
-@dataclass
+@dataclass(frozen=True)
 class DelayCommand:
     """Delay command in milliseconds."""
 
+    __slots__ = ("duration_ms",)
+
     duration_ms: int
 
     def __str__(self) -> str:
         return f"D{self.duration_ms}"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ResetCommand:
     """Reset all relays to OFF."""
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         return "I"
 
@@ -42,25 +65,73 @@ Command = Union[RelayCommand, DelayCommand, ResetCommand]
 
 
 class SequenceParser:
-    """Parses relay command sequences."""
+    """
+    Parses relay command sequences.
+
+    Commands are case-insensitive:
+        R<id>:ON / R<id>:OFF  - id is a relay number or alias ([a-z0-9_]+)
+        D<ms>                 - delay in milliseconds
+        I                     - reset all relays
+
+    Tokens are recognised by their first character and sliced directly
+    rather than matched against regexes.
+
+    parse_packed() returns the sequence as an array of packed 64-bit words,
+    one per command: the low OP_BITS bits hold the opcode and the rest its
+    argument (relay_num << 1 | on for relays, milliseconds for delays).
+    parse() builds Command objects from that.
+    """
+
+    # Characters allowed in a relay number or alias (after lowercasing)
+    RELAY_ID_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789_"
+
+    # Packed command words
+    OP_RELAY = 0
+    OP_DELAY = 1
+    OP_RESET = 2
+    OP_BITS = 4
+    OP_MASK = (1 << OP_BITS) - 1
+
+    def __init__(self, relay_aliases: dict[str, int] = None):
+        """
+        Initialize parser.
 
-    # Pattern for relay command: R1:ON, R16:OFF, Ralias:ON, etc.
-    RELAY_PATTERN = re.compile(r"^R([a-z0-9_]+):(ON|OFF)$", re.IGNORECASE)
+        Relay numbers and aliases are merged into a single lookup table up
+        front, so each relay token is resolved with one dict lookup.
 
-    # Pattern for delay: D500, D1000, etc.
-    DELAY_PATTERN = re.compile(r"^D(\d+)$", re.IGNORECASE)
+        Args:
+            relay_aliases: Optional dict mapping alias names to relay numbers
+        """
+        self.relay_aliases = relay_aliases or {}
+        self._id_table = {name.lower(): num for name, num in self.relay_aliases.items()}
+        # Plain numbers take precedence over an alias spelled the same way
+        self._id_table.update(
+            (str(num), num)
+            for num in range(RelayController.MIN_RELAY, RelayController.MAX_RELAY + 1)
+        )
+
+    def resolve_relay(self, relay_id: str) -> Optional[int]:
+        """
+        Look up a relay number or alias, case-insensitively.
 
-    # Pattern for reset: I
-    RESET_PATTERN = re.compile(r"^I$", re.IGNORECASE)
+        Numbers are not range-checked, so out-of-range ones still resolve and
+        can be reported as such.
 
-    @classmethod
-    def parse(cls, sequence_str: str, relay_aliases: dict[str, int] = None) -> list[Command]:
+        Returns:
+            The relay number, or None if relay_id is neither a number nor a known alias
+        """
+        relay_id = relay_id.lower()
+        relay_num = self._id_table.get(relay_id)
+        if relay_num is None and relay_id.isdecimal():
+            relay_num = int(relay_id)
+        return relay_num
+
+    def parse(self, sequence_str: str) -> list[Command]:
         """
         Parse comma-separated sequence string.
 
         Args:
             sequence_str: e.g., "R1:ON,D500,R1:OFF" or "Rdut1_reset:ON,D500,Rdut1_reset:OFF"
-            relay_aliases: Optional dict mapping alias names to relay numbers
 
         Returns:
             List of Command objects
@@ -68,58 +139,212 @@ class SequenceParser:
         Raises:
             ValueError: If sequence contains invalid commands
         """
-        commands = []
-        relay_aliases = relay_aliases or {}
+        return self.unpack(self.parse_packed(sequence_str))
+
+    def parse_packed(self, sequence_str: str) -> array:
+        """
+        Parse comma-separated sequence string into packed command words.
+
+        Args:
+            sequence_str: Same syntax as parse()
 
-        parts = [p.strip() for p in sequence_str.split(",")]
+        Returns:
+            array('Q') with one packed word per command
 
-        for part in parts:
+        Raises:
+            ValueError: If sequence contains invalid commands
+        """
+        words = array("Q")
+
+        # Bound once for the loop
+        append = words.append
+        op_bits = self.OP_BITS
+        op_delay = self.OP_DELAY
+        lookup = self._id_table.get
+        id_chars = self.RELAY_ID_CHARS
+        min_relay = RelayController.MIN_RELAY
+        max_relay = RelayController.MAX_RELAY
+
+        for part in sequence_str.split(","):
+            part = part.strip()
             if not part:
                 continue
 
-            # Try relay pattern
-            relay_match = cls.RELAY_PATTERN.match(part)
-            if relay_match:
-                relay_id = relay_match.group(1).lower()
-                on = relay_match.group(2).upper() == "ON"
+            head = part[0]
+
+            # Relay command: R1:ON, R16:OFF, Ralias:ON, etc.
+            if head == "R" or head == "r":
+                colon = part.find(":")
+                relay_id = part[1:colon].lower()
+                state = part[colon + 1 :].upper()
+                # Anything left after stripping id_chars is an invalid character
+                bad_id = not relay_id or relay_id.strip(id_chars)
+                if colon < 0 or bad_id or state not in ("ON", "OFF"):
+                    raise ValueError(f"Invalid command: {part}")
+
+                relay_num = lookup(relay_id)
+                if relay_num is None:
+                    # Not in the table: a number out of range (or zero-padded),
+                    # or an unknown alias
+                    relay_num = self.resolve_relay(relay_id)
+                    if relay_num is None:
+                        raise ValueError(f"Unknown relay alias: {relay_id}")
+
+                if not min_relay <= relay_num <= max_relay:
+                    raise ValueError(
+                        f"Relay number must be {min_relay}-{max_relay}, got {relay_num}"
+                    )
+
+                append((relay_num << 1 | (state == "ON")) << op_bits)
 
-                # Try to parse as number first, then check aliases
+            # Delay: D500, D1000, etc.
+            elif (head == "D" or head == "d") and part[1:].isdecimal():
                 try:
-                    relay_num = int(relay_id)
-                except ValueError:
-                    # Not a number, check if it's an alias
-                    if relay_id in relay_aliases:
-                        relay_num = relay_aliases[relay_id]
-                    else:
-                        raise ValueError(f"Unknown relay alias: {relay_id}")
+                    append(int(part[1:]) << op_bits | op_delay)
+                except OverflowError:
+                    raise ValueError(f"Delay too long: {part}") from None
 
-                if not 1 <= relay_num <= 16:
-                    raise ValueError(f"Relay number must be 1-16, got {relay_num}")
+            # Reset: I
+            elif part == "I" or part == "i":
+                append(self.OP_RESET)
 
-                commands.append(RelayCommand(relay_num=relay_num, on=on))
-                continue
+            else:
+                raise ValueError(f"Invalid command: {part}")
 
-            # Try delay pattern
-            delay_match = cls.DELAY_PATTERN.match(part)
-            if delay_match:
-                duration = int(delay_match.group(1))
-                commands.append(DelayCommand(duration_ms=duration))
-                continue
+        return words
 
-            # Try reset pattern
-            reset_match = cls.RESET_PATTERN.match(part)
-            if reset_match:
-                commands.append(ResetCommand())
-                continue
+    @classmethod
+    def pack(cls, commands: Sequence[Command]) -> array:
+        """
+        Pack Command objects into words, as returned by parse_packed().
+
+        Raises:
+            ValueError: If an item isn't a command or its value doesn't fit in a word
+        """
+        words = array("Q")
+        append = words.append
+        op_bits = cls.OP_BITS
 
-            raise ValueError(f"Invalid command: {part}")
+        for cmd in commands:
+            try:
+                if isinstance(cmd, RelayCommand):
+                    append((cmd.relay_num << 1 | bool(cmd.on)) << op_bits)
+                elif isinstance(cmd, DelayCommand):
+                    append(cmd.duration_ms << op_bits | cls.OP_DELAY)
+                elif isinstance(cmd, ResetCommand):
+                    append(cls.OP_RESET)
+                else:
+                    raise ValueError(f"Invalid command: {cmd!r}")
+            except OverflowError:
+                raise ValueError(f"Invalid command: {cmd!r}") from None
+
+        return words
+
+    @classmethod
+    def unpack(cls, words: Sequence[int]) -> list[Command]:
+        """
+        Build Command objects from packed words.
+
+        Raises:
+            ValueError: If a word has an unknown opcode
+        """
+        commands: list[Command] = []
+        append = commands.append
+        op_bits = cls.OP_BITS
+        op_mask = cls.OP_MASK
+
+        for word in words:
+            op = word & op_mask
+            arg = word >> op_bits
+            if op == cls.OP_RELAY:
+                append(RelayCommand(relay_num=arg >> 1, on=bool(arg & 1)))
+            elif op == cls.OP_DELAY:
+                append(DelayCommand(duration_ms=arg))
+            elif op == cls.OP_RESET:
+                append(ResetCommand())
+            else:
+                raise ValueError(f"Invalid command word: {word:#x}")
 
         return commands
 
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop the parsed sequences cached for SequenceExecutor.execute_string()."""
+        _parse_cached.cache_clear()
+        _parser_for.cache_clear()
+
+
+@functools.lru_cache(maxsize=16)
+def _parser_for(aliases_key: tuple[tuple[str, int], ...]) -> SequenceParser:
+    """Return a shared parser for a hashable alias table."""
+    return SequenceParser(dict(aliases_key))
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_cached(sequence_str: str, aliases_key: tuple[tuple[str, int], ...]) -> bytes:
+    """
+    Parse a sequence to packed words, memoized on the string and a hashable alias table.
+
+    The result is shared between callers, so the words are returned as
+    immutable bytes; memoryview(...).cast("Q") reads them back.
+    """
+    return _parser_for(aliases_key).parse_packed(sequence_str).tobytes()
+
+
+# How much of each delay is spent spinning on perf_counter instead of sleeping
+_SPIN_S = 0.002
+
+_timer_period_raised = False
+
+
+def _precise_sleep(duration_s: float) -> None:
+    """Sleep until duration_s has elapsed, spinning through the last couple of ms."""
+    end = time.perf_counter() + duration_s
+    coarse = duration_s - _SPIN_S
+    if coarse > 0:
+        time.sleep(coarse)
+    while time.perf_counter() < end:
+        pass
+
+
+def _raise_timer_resolution() -> None:
+    """
+    Ask Windows for a 1 ms timer period so short sleeps aren't rounded up to ~15.6 ms.
+
+    Done once per process and undone at exit. Best effort: any failure leaves
+    the default resolution in place, which _precise_sleep() still copes with.
+    """
+    global _timer_period_raised
+    if _timer_period_raised or sys.platform != "win32":
+        return
+    _timer_period_raised = True
+
+    try:
+        import ctypes
+
+        winmm = ctypes.windll.winmm
+        if winmm.timeBeginPeriod(1) == 0:
+            atexit.register(winmm.timeEndPeriod, 1)
+    except (ImportError, AttributeError, OSError):
+        pass
+
 
 class SequenceExecutor:
     """Executes parsed command sequences."""
 
+    # Opcodes of a compiled program (see compile())
+    OP_WRITE = 0  # send a bytes blob and wait for it to drain
+    OP_SLEEP = 1  # sleep for a float number of seconds
+    OP_RESET = 2  # reset all relays
+    OP_WRITE_NOWAIT = 3  # send a bytes blob without waiting; a long enough sleep follows
+    OP_PRINT = 4  # write verbose text to stdout
+
+    # Compiled programs kept per executor by execute_string()
+    PROGRAM_CACHE_SIZE = 256
+
+    # Live executors, so clear_cache() can reach their program caches
+    _instances: "weakref.WeakSet[SequenceExecutor]" = weakref.WeakSet()
+
     def __init__(
         self, relay_controller: RelayController, verbose: bool = True, relay_aliases: dict[str, int] = None
     ):
@@ -134,28 +359,182 @@ class SequenceExecutor:
         self.relay = relay_controller
         self.verbose = verbose
         self.relay_aliases = relay_aliases or {}
+        self._programs: dict[tuple, list[tuple[int, object]]] = {}
+        SequenceExecutor._instances.add(self)
+        _raise_timer_resolution()
 
-    def execute(self, commands: list[Command]) -> None:
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop everything execute_string() caches: parsed sequences and all executors' programs."""
+        SequenceParser.clear_cache()
+        for executor in cls._instances:
+            executor._programs.clear()
+
+    def compile(self, commands: Sequence[Command]) -> list[tuple[int, object]]:
         """
-        Execute a sequence of commands.
+        Translate commands into a flat program of (op, arg) pairs.
+
+        Consecutive relay commands become a single write of their joined
+        frames. When a delay follows that is longer than the write takes to
+        transmit, the write doesn't wait for the port to drain.
+
+        With verbose on, the "Executing:" lines for everything up to and
+        including the next delay are printed in one write ahead of that
+        stretch, so progress still shows up before every wait.
 
         Args:
             commands: List of parsed commands
+
+        Returns:
+            Program for execute_compiled()
+
+        Raises:
+            ValueError: If a relay command is out of range
         """
-        for cmd in commands:
-            if self.verbose:
-                print(f"Executing: {cmd}")
+        return self.compile_packed(SequenceParser.pack(commands))
 
-            if isinstance(cmd, RelayCommand):
-                self.relay.set_relay(cmd.relay_num, cmd.on)
+    def compile_packed(self, words: Sequence[int]) -> list[tuple[int, object]]:
+        """
+        Same as compile(), for packed words from SequenceParser.parse_packed().
 
-            elif isinstance(cmd, DelayCommand):
-                time.sleep(cmd.duration_ms / 1000.0)
+        No Command objects are created; verbose text is built from the words.
 
-            elif isinstance(cmd, ResetCommand):
-                self.relay.reset_all_relays()
+        Raises:
+            ValueError: If a word has an unknown opcode or a relay is out of range
+        """
+        program: list[tuple[int, object]] = []
+        # Ops since the last delay, emitted after that stretch's verbose text
+        segment: list[tuple[int, object]] = []
+        # Frames for a run of relay commands not yet emitted
+        pending: list[bytes] = []
+        # Verbose lines for the current stretch
+        out: list[str] = []
+        verbose = self.verbose
+        command_bytes = self.relay.command_bytes
+        transmit_time_ms = self.relay.transmit_time_ms
+        op_bits = SequenceParser.OP_BITS
+        op_mask = SequenceParser.OP_MASK
+        op_relay = SequenceParser.OP_RELAY
+        op_delay = SequenceParser.OP_DELAY
+        op_reset = SequenceParser.OP_RESET
+
+        def end_segment() -> None:
+            if out:
+                program.append((self.OP_PRINT, "".join(out)))
+                out.clear()
+            program.extend(segment)
+            segment.clear()
+
+        for word in words:
+            op = word & op_mask
+            arg = word >> op_bits
+
+            if op != op_relay and op != op_delay and op != op_reset:
+                raise ValueError(f"Invalid command word: {word:#x}")
+
+            if op == op_relay:
+                relay_num = arg >> 1
+                on = bool(arg & 1)
+                if verbose:
+                    text = _RELAY_STRS.get((relay_num, on))
+                    if text is None:
+                        text = f"R{relay_num}:{'ON' if on else 'OFF'}"
+                    out.append(f"Executing: {text}\n")
+                pending.append(command_bytes(relay_num, on))
+                continue
+
+            if verbose:
+                out.append(f"Executing: D{arg}\n" if op == op_delay else "Executing: I\n")
+
+            if pending:
+                blob = b"".join(pending)
+                pending = []
+                # If the following delay outlasts transmission, the frames
+                # finish going out during the sleep; no need to block on drain
+                nowait = op == op_delay and arg >= transmit_time_ms(len(blob))
+                segment.append((self.OP_WRITE_NOWAIT if nowait else self.OP_WRITE, blob))
+
+            if op == op_delay:
+                segment.append((self.OP_SLEEP, arg / 1000.0))
+                end_segment()
+            else:
+                segment.append((self.OP_RESET, None))
+
+        if pending:
+            segment.append((self.OP_WRITE, b"".join(pending)))
+        end_segment()
+
+        return program
+
+    def execute_compiled(self, program: Sequence[tuple[int, object]]) -> None:
+        """
+        Run a program built by compile().
+
+        Args:
+            program: (op, arg) pairs from compile()
+
+        Raises:
+            ValueError: If the program contains an unknown op
+        """
+        send = self.relay.send_raw
+        reset = self.relay.reset_all_relays
+        write_output = self._write_output
+        op_sleep = self.OP_SLEEP
+        op_write = self.OP_WRITE
+        op_write_nowait = self.OP_WRITE_NOWAIT
+        op_print = self.OP_PRINT
+        op_reset = self.OP_RESET
+
+        for op, arg in program:
+            if op == op_sleep:
+                _precise_sleep(arg)
+            elif op == op_write:
+                send(arg)
+            elif op == op_write_nowait:
+                send(arg, flush=False)
+            elif op == op_print:
+                write_output(arg)
+            elif op == op_reset:
+                reset()
+            else:
+                raise ValueError(f"Invalid program op: {op!r}")
+
+    def execute(self, commands: Sequence[Command]) -> None:
+        """
+        Execute a sequence of commands.
+
+        The commands are compiled first (see compile()), so consecutive relay
+        commands go out in one write and verbose output is batched. Delays
+        sleep for all but the last couple of milliseconds and spin for the
+        rest, so short delays stay accurate.
+
+        Args:
+            commands: List of parsed commands
+        """
+        self.execute_compiled(self.compile(commands))
+
+    @staticmethod
+    def _write_output(text: str) -> None:
+        """Write batched verbose text with a single stdout write."""
+        sys.stdout.write(text)
+        sys.stdout.flush()
 
     def execute_string(self, sequence_str: str) -> None:
-        """Parse and execute a sequence string."""
-        commands = SequenceParser.parse(sequence_str, relay_aliases=self.relay_aliases)
-        self.execute(commands)
+        """
+        Parse and execute a sequence string.
+
+        Compiled programs are cached, so repeating the same string (with the
+        same aliases) skips parsing and compiling.
+        """
+        aliases_key = tuple(sorted(self.relay_aliases.items()))
+        key = (sequence_str, aliases_key, self.verbose)
+
+        program = self._programs.get(key)
+        if program is None:
+            words = memoryview(_parse_cached(sequence_str, aliases_key)).cast("Q")
+            program = self.compile_packed(words)
+            if len(self._programs) >= self.PROGRAM_CACHE_SIZE:
+                self._programs.clear()
+            self._programs[key] = program
+
+        self.execute_compiled(program)
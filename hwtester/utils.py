@@ -1,6 +1,11 @@
 """Shared utilities for checksum calculation and timestamps."""
 
 import datetime
+import time
+
+# (whole second, "[YYYY-mm-dd HH:MM:SS." for that second), replaced as one
+# tuple so threads never see a mismatched pair
+_line_ts_cache: tuple[int, str] = (-1, "")
 
 
 def calculate_intel_hex_checksum(data_bytes: bytes) -> int:
@@ -16,9 +21,8 @@ def calculate_intel_hex_checksum(data_bytes: bytes) -> int:
     Returns:
         Single byte checksum value (0-255)
     """
-    total = sum(data_bytes)
-    checksum = (~total + 1) & 0xFF
-    return checksum
+    # sum() over bytes already runs in C; -total is the two's complement
+    return (-sum(data_bytes)) & 0xFF
 
 
 def format_timestamp(fmt: str = "%Y%m%d_%H%M%S") -> str:
@@ -27,5 +31,17 @@ def format_timestamp(fmt: str = "%Y%m%d_%H%M%S") -> str:
 
 
 def format_line_timestamp() -> str:
-    """Return timestamp for log line prefixing."""
-    return datetime.datetime.now().strftime("[%Y-%m-%d %H:%M:%S.%f")[:-3] + "] "
+    """
+    Return timestamp for log line prefixing, e.g. "[2024-01-31 12:00:00.123] ".
+
+    The date/time part is formatted at most once per second; only the
+    milliseconds are computed on each call.
+    """
+    global _line_ts_cache
+    now = time.time()
+    sec = int(now)
+    cached_sec, prefix = _line_ts_cache
+    if sec != cached_sec:
+        prefix = time.strftime("[%Y-%m-%d %H:%M:%S.", time.localtime(sec))
+        _line_ts_cache = (sec, prefix)
+    return f"{prefix}{int((now - sec) * 1000):03d}] "